@@ -0,0 +1,114 @@
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+import asyncio
+import time
+
+
+class TTLCache:
+    """Bounded in-memory cache with per-entry expiry and LRU eviction."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key, evicting the least recently used entries when full."""
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key from the cache and return its value."""
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class AsyncTTLCache:
+    """Async cache with stale-while-revalidate and single-flight loading.
+
+    Entries are fresh for ttl_fresh seconds, then served stale for up to ttl_stale
+    more seconds while one background task refreshes them. Concurrent requests
+    for the same key share a single in-flight loader call instead of stampeding
+    the API, even when caching is disabled with a zero TTL.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self._entries = TTLCache(maxsize=maxsize)
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    def set(self, key: Hashable, value: Any, ttl_fresh: float, ttl_stale: float = 0) -> None:
+        """Store value directly, e.g. to prime the cache with data fetched elsewhere."""
+        if ttl_fresh <= 0:
+            return
+        self._entries.set(key, (time.monotonic() + ttl_fresh, value), ttl=ttl_fresh + ttl_stale)
+
+    def pop(self, key: Hashable) -> None:
+        """Invalidate key."""
+        self._entries.pop(key)
+
+    async def fetch_with_swr(
+        self,
+        key: Hashable,
+        ttl_fresh: float,
+        ttl_stale: float,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the cached value for key, loading it with loader() on a miss."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            fresh_until, value = entry
+            if time.monotonic() >= fresh_until:
+                # Stale: answer now and refresh in the background
+                self._load(key, ttl_fresh, ttl_stale, loader)
+            return value
+
+        # Shielded so a cancelled caller doesn't abort the load other callers wait on
+        return await asyncio.shield(self._load(key, ttl_fresh, ttl_stale, loader))
+
+    def _load(self, key, ttl_fresh, ttl_stale, loader) -> asyncio.Task:
+        """Start loading key, or join the load already in flight for it."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._run_loader(key, ttl_fresh, ttl_stale, loader))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish_load(key, done))
+        return task
+
+    async def _run_loader(self, key, ttl_fresh, ttl_stale, loader) -> Any:
+        value = await loader()
+        self.set(key, value, ttl_fresh, ttl_stale)
+        return value
+
+    def _finish_load(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark failures as retrieved: a failed background refresh just keeps the stale value
+        if not task.cancelled():
+            task.exception()
@@ -4,12 +4,35 @@ import os
 class Config:
     """Configuration for Fathom MCP Server"""
 
-    def __init__(self):
-        self.api_key = os.getenv("FATHOM_API_KEY", "")
+    def __init__(self, environ=None):
+        # Snapshot the environment once so every setting is a plain dict lookup
+        env = dict(os.environ if environ is None else environ)
+
+        self.api_key = env.get("FATHOM_API_KEY", "")
         self.base_url = "https://api.fathom.ai/external/v1"
-        self.timeout = int(os.getenv("FATHOM_TIMEOUT", "30"))
-        self.output_format = os.getenv("OUTPUT_FORMAT", "hybrid")
-        self.default_per_page = int(os.getenv("DEFAULT_PER_PAGE", "50"))
+        self.timeout = int(env.get("FATHOM_TIMEOUT", "30"))
+        self.connect_timeout = float(env.get("FATHOM_CONNECT_TIMEOUT", "5"))
+        self.output_format = env.get("OUTPUT_FORMAT", "hybrid")
+        self.default_per_page = int(env.get("DEFAULT_PER_PAGE", "50"))
+        self.cache_ttl = int(env.get("FATHOM_CACHE_TTL", "300"))
+        self.meetings_cache_ttl = int(env.get("FATHOM_MEETINGS_CACHE_TTL", "30"))
+        self.recording_cache_ttl = int(env.get("FATHOM_RECORDING_CACHE_TTL", "3600"))
+        self.cache_stale_ttl = int(env.get("FATHOM_CACHE_STALE_TTL", "600"))
+        self.cache_size = int(env.get("FATHOM_CACHE_SIZE", "1024"))
+        self.max_retries = int(env.get("FATHOM_MAX_RETRIES", "5"))
+        self.retry_base = float(env.get("FATHOM_RETRY_BASE", "0.25"))
+        self.retry_cap = float(env.get("FATHOM_RETRY_CAP", "30"))
+        # Page size requested by search and by get_meeting lookups
+        self.search_page_limit = int(env.get("FATHOM_SEARCH_PAGE_LIMIT", "500"))
+        self.transcript_concurrency = int(env.get("FATHOM_TRANSCRIPT_CONCURRENCY", "8"))
+        self.debug_logging = env.get("FATHOM_DEBUG", "").lower() in ("1", "true", "yes")
+
+        # Headers for Fathom API requests, built once instead of per access
+        self.headers = {
+            "X-Api-Key": self.api_key,
+            "Content-Type": "application/json",
+            "User-Agent": "Fathom-MCP-Server/1.0"
+        }
 
     def validate(self) -> bool:
         """Validate configuration
@@ -31,9 +54,39 @@ class Config:
         if self.timeout <= 0:
             errors.append("FATHOM_TIMEOUT must be a positive integer")
 
+        if self.connect_timeout <= 0:
+            errors.append("FATHOM_CONNECT_TIMEOUT must be a positive number")
+
         if self.default_per_page <= 0:
             errors.append("DEFAULT_PER_PAGE must be a positive integer")
 
+        if self.search_page_limit <= 0:
+            errors.append("FATHOM_SEARCH_PAGE_LIMIT must be a positive integer")
+
+        if self.transcript_concurrency <= 0:
+            errors.append("FATHOM_TRANSCRIPT_CONCURRENCY must be a positive integer")
+
+        if self.cache_ttl < 0:
+            errors.append("FATHOM_CACHE_TTL must be zero or a positive integer")
+
+        if self.meetings_cache_ttl < 0:
+            errors.append("FATHOM_MEETINGS_CACHE_TTL must be zero or a positive integer")
+
+        if self.recording_cache_ttl < 0:
+            errors.append("FATHOM_RECORDING_CACHE_TTL must be zero or a positive integer")
+
+        if self.cache_stale_ttl < 0:
+            errors.append("FATHOM_CACHE_STALE_TTL must be zero or a positive integer")
+
+        if self.cache_size < 0:
+            errors.append("FATHOM_CACHE_SIZE must be zero or a positive integer")
+
+        if self.max_retries < 0:
+            errors.append("FATHOM_MAX_RETRIES must be zero or a positive integer")
+
+        if self.retry_base <= 0 or self.retry_cap <= 0:
+            errors.append("FATHOM_RETRY_BASE and FATHOM_RETRY_CAP must be positive numbers")
+
         if self.output_format not in ("toon", "json", "hybrid"):
             errors.append("OUTPUT_FORMAT must be 'toon', 'json', or 'hybrid'")
 
@@ -42,15 +95,6 @@ class Config:
 
         return True
 
-    @property
-    def headers(self) -> dict:
-        """Return headers for Fathom API requests"""
-        return {
-            "X-Api-Key": self.api_key,
-            "Content-Type": "application/json",
-            "User-Agent": "Fathom-MCP-Server/1.0"
-        }
-
 
 # Global config instance
-config = Config()
\ No newline at end of file
+config = Config()
@@ -2,9 +2,50 @@
 __version__ = "0.1.0"
 
 import httpx
-from typing import Dict, Any, Optional
+import orjson
+from typing import Dict, Any, List, Optional, Tuple, Union
 from config import config
+from cache import AsyncTTLCache, TTLCache
+from rate_limit import RateLimiter
 import asyncio
+import atexit
+import random
+
+# Status codes worth retrying: rate limiting and transient server errors
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Endpoint URLs, built once instead of on every request
+_MEETINGS_URL = config.base_url + "/meetings"
+_TEAMS_URL = config.base_url + "/teams"
+_TEAM_MEMBERS_URL = config.base_url + "/team_members"
+# get_meeting scans at most this many of the most recent meetings before giving up
+_MAX_MEETINGS_SCANNED = 500
+# recording_ids get_meeting failed to find are answered with 404 for this long without rescanning
+_MISSING_MEETING_TTL = 600
+# Cursor-keyed pages are rarely read twice and expire only when read, so keep just a few
+_MEETINGS_PAGE_CACHE_SIZE = 32
+# Bodies above this size (e.g. long transcripts) are decoded in a worker thread
+_LARGE_BODY_BYTES = 512 * 1024
+
+_RECORDING_URL_FMTS = {
+    "summary": (config.base_url + "/recordings/{}/summary").format,
+    "transcript": (config.base_url + "/recordings/{}/transcript").format,
+}
+
+def _prepare_params(params: Optional[dict]) -> Optional[List[Tuple[str, Any]]]:
+    """Drop None values and expand list values into repeated query keys"""
+    if not params:
+        return None
+
+    prepared = []
+    for key, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            prepared.extend((key, item) for item in value)
+        else:
+            prepared.append((key, value))
+    return prepared or None
 
 class FathomAPIError(Exception):
     """Custom exception for Fathom API errors"""
@@ -17,17 +58,68 @@ class FathomClient:
     """Async HTTP client for Fathom API"""
     
     def __init__(self):
-        self.client = httpx.AsyncClient(
-            timeout=config.timeout,
-            headers=config.headers
+        # The HTTP client is created on first use, inside the event loop that runs the requests
+        self.client: Optional[httpx.AsyncClient] = None
+        self._client_lock = asyncio.Lock()
+        self.rate_limiter = RateLimiter()
+        # Recently fetched /meetings pages, keyed by their prepared query parameters
+        self._meetings_page_cache = AsyncTTLCache(maxsize=_MEETINGS_PAGE_CACHE_SIZE)
+        # Page sizes to use instead of config.search_page_limit, by request shape (the sorted
+        # parameter names), for shapes where the API rejected the large page with 400/422
+        self._page_limits: Dict[tuple, int] = {}
+        # Meeting metadata, keyed by recording_id
+        self._meeting_cache = AsyncTTLCache(maxsize=config.cache_size)
+        # recording_ids a recent scan didn't find
+        self._missing_meetings = TTLCache(maxsize=config.cache_size, ttl=_MISSING_MEETING_TTL)
+        # Summaries and transcripts don't change once generated, so keep them longer
+        self._recording_cache = AsyncTTLCache(maxsize=config.cache_size)
+
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """Build the shared HTTP client with a keep-alive connection pool"""
+        # Limits must be set on the transport: AsyncClient ignores limits= when a transport is given
+        limits = httpx.Limits(
+            max_connections=64,
+            max_keepalive_connections=32,
+            keepalive_expiry=30.0
+        )
+        return httpx.AsyncClient(
+            # Fail fast on unreachable hosts; only reads get the full timeout
+            timeout=httpx.Timeout(config.timeout, connect=min(config.connect_timeout, config.timeout)),
+            headers=config.headers,
+            transport=httpx.AsyncHTTPTransport(limits=limits, retries=0)
         )
 
-    async def _request(self, method: str, endpoint: str, params: Optional[dict] = None) -> Dict[str, Any]:
-        """Make HTTP request to Fathom API"""
-        url = f"{config.base_url}{endpoint}"
-        
+    async def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use"""
+        if self.client is None or self.client.is_closed:
+            async with self._client_lock:
+                if self.client is None or self.client.is_closed:
+                    self.client = self._create_http_client()
+        return self.client
+
+    async def _request(self, method: str, url: str, params: Optional[Union[dict, List[Tuple[str, Any]]]] = None) -> Dict[str, Any]:
+        """Make HTTP request to a full Fathom API URL"""
+        http = await self._get_http_client()
         try:
-            response = await self.client.request(method, url, params=params)
+            for attempt in range(config.max_retries + 1):
+                try:
+                    async with self.rate_limiter.acquire():
+                        response = await http.request(method, url, params=params)
+                except httpx.TransportError:
+                    # Connection resets, timeouts and DNS hiccups are usually transient
+                    self.rate_limiter.record_result(False)
+                    if attempt == config.max_retries:
+                        raise
+                    await asyncio.sleep(self._retry_delay(attempt))
+                    continue
+
+                self.rate_limiter.update(response.headers)
+                self.rate_limiter.record_result(response.status_code not in RETRY_STATUS_CODES)
+
+                if response.status_code not in RETRY_STATUS_CODES or attempt == config.max_retries:
+                    break
+
+                await asyncio.sleep(self._retry_delay(attempt, response))
             
             # Handle rate limiting
             if response.status_code == 429:
@@ -42,14 +134,18 @@ class FathomClient:
                 )
             
             if response.status_code == 200:
-                return response.json()
+                content = response.content
+                if len(content) > _LARGE_BODY_BYTES:
+                    # Keep the event loop serving other tool calls while a big payload decodes
+                    return await asyncio.to_thread(orjson.loads, content)
+                return orjson.loads(content)
             elif response.status_code == 401:
                 raise FathomAPIError("Unauthorized: Invalid API key", 401)
             elif response.status_code == 404:
                 raise FathomAPIError("Resource not found", 404)
             else:
                 try:
-                    error_data = response.json()
+                    error_data = orjson.loads(response.content)
                     error_message = error_data.get("message", "Unknown error")
                     raise FathomAPIError(f"HTTP {response.status_code}: {error_message}", response.status_code)
                 except Exception:
@@ -61,48 +157,144 @@ class FathomClient:
         except httpx.RequestError as e:
             raise FathomAPIError(f"Request failed: {str(e)}")
 
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Exponential backoff with jitter, honoring Retry-After and rate limit resets"""
+        delay = min(config.retry_cap, config.retry_base * 2 ** attempt)
+        delay += random.uniform(0, config.retry_base)
+
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            if response.status_code == 429:
+                delay = max(delay, self.rate_limiter.retry_after())
+
+        return delay
+
     async def get_meetings(self, params: Optional[dict] = None) -> Dict[str, Any]:
-        """Get meetings with optional parameters"""
-        return await self._request("GET", "/meetings", params=params)
+        """Get meetings with optional parameters, reusing a page fetched in the last few seconds"""
+        prepared = _prepare_params(params)
+        if params and params.get("include_transcript"):
+            # Pages with embedded transcripts are too large to keep, and searches rarely repeat them
+            return await self._request("GET", _MEETINGS_URL, params=prepared)
+        # Failed requests are never stored, so an error always retries on the next call
+        return await self._meetings_page_cache.fetch_with_swr(
+            tuple(prepared) if prepared else (),
+            config.meetings_cache_ttl,
+            0,
+            lambda: self._request("GET", _MEETINGS_URL, params=prepared)
+        )
+
+    async def get_meetings_first_page(self, params: Optional[dict] = None) -> Tuple[Dict[str, Any], int]:
+        """Get the first page of meetings at config.search_page_limit, falling back to DEFAULT_PER_PAGE on 400/422
+
+        Returns the response and the page size used, so later pages can be requested at the same size
+        """
+        params = params or {}
+        shape = tuple(sorted(params))
+        limit = self._page_limits.get(shape, config.search_page_limit)
+        try:
+            return await self.get_meetings(params={**params, "limit": limit}), limit
+        except FathomAPIError as e:
+            if e.status_code not in (400, 422) or limit <= config.default_per_page:
+                raise
+        # The API refused the large page; remember that so later calls don't re-probe
+        limit = self._page_limits[shape] = config.default_per_page
+        return await self.get_meetings(params={**params, "limit": limit}), limit
 
     async def get_meeting(self, recording_id: int) -> Dict[str, Any]:
-        """Get a single meeting by recording ID - fetches from meetings list and filters"""
-        # Get meetings list and filter by recording_id
-        meetings_data = await self.get_meetings()
-        
-        # Search for the specific meeting by recording_id
-        for meeting in meetings_data.get("items", []):
-            if meeting.get("recording_id") == recording_id:
-                return meeting
-        
-        # If not found, raise appropriate error
+        """Get a single meeting by recording ID - pages through the most recent meetings until found"""
+        return await self._meeting_cache.fetch_with_swr(
+            recording_id,
+            config.cache_ttl,
+            config.cache_stale_ttl,
+            lambda: self._find_meeting(recording_id)
+        )
+
+    async def _find_meeting(self, recording_id: int) -> Dict[str, Any]:
+        """Scan the most recent meetings page by page for recording_id, caching every meeting seen"""
+        if self._missing_meetings.get(recording_id) is not None:
+            raise FathomAPIError(f"Meeting with recording_id {recording_id} not found", 404)
+
+        # One large page usually covers the whole scan, so a miss costs a single request
+        meetings_data, limit = await self.get_meetings_first_page()
+        scanned = 0
+        while True:
+            items = meetings_data.get("items", [])
+            scanned += len(items)
+
+            found = None
+            for meeting in items:
+                # Remember every meeting seen so later lookups skip the scan
+                meeting_id = meeting.get("recording_id")
+                if meeting_id is not None:
+                    self._meeting_cache.set(meeting_id, meeting, config.cache_ttl, config.cache_stale_ttl)
+                    self._missing_meetings.pop(meeting_id)
+                if meeting_id == recording_id:
+                    found = meeting
+
+            if found is not None:
+                return found
+
+            cursor = meetings_data.get("next_cursor") or meetings_data.get("cursor")
+            if not items or not cursor or scanned >= _MAX_MEETINGS_SCANNED:
+                break
+            meetings_data = await self.get_meetings(params={"limit": limit, "cursor": cursor})
+
+        # Not among the recent meetings; remember that so the next lookup doesn't rescan
+        self._missing_meetings.set(recording_id, True)
         raise FathomAPIError(f"Meeting with recording_id {recording_id} not found", 404)
 
+    async def _get_recording_content(self, kind: str, recording_id: int, destination_url: Optional[str] = None) -> Dict[str, Any]:
+        """Get summary or transcript for a recording, served from cache when possible"""
+        url = _RECORDING_URL_FMTS[kind](recording_id)
+
+        # With destination_url the API delivers the content asynchronously, so never cache it
+        if destination_url:
+            return await self._request("GET", url, params={"destination_url": destination_url})
+
+        return await self._recording_cache.fetch_with_swr(
+            (kind, recording_id),
+            config.recording_cache_ttl,
+            config.cache_stale_ttl,
+            lambda: self._request("GET", url)
+        )
+
     async def get_summary(self, recording_id: int, destination_url: Optional[str] = None) -> Dict[str, Any]:
         """Get summary for a recording"""
-        params = {}
-        if destination_url:
-            params["destination_url"] = destination_url
-        return await self._request("GET", f"/recordings/{recording_id}/summary", params=params)
+        return await self._get_recording_content("summary", recording_id, destination_url)
 
     async def get_transcript(self, recording_id: int, destination_url: Optional[str] = None) -> Dict[str, Any]:
         """Get transcript for a recording"""
-        params = {}
-        if destination_url:
-            params["destination_url"] = destination_url
-        return await self._request("GET", f"/recordings/{recording_id}/transcript", params=params)
+        return await self._get_recording_content("transcript", recording_id, destination_url)
 
     async def get_teams(self, params: Optional[dict] = None) -> Dict[str, Any]:
         """Get teams with optional parameters"""
-        return await self._request("GET", "/teams", params=params)
+        return await self._request("GET", _TEAMS_URL, params=_prepare_params(params))
 
     async def get_team_members(self, params: Optional[dict] = None) -> Dict[str, Any]:
         """Get team members with optional parameters"""
-        return await self._request("GET", "/team_members", params=params)
+        return await self._request("GET", _TEAM_MEMBERS_URL, params=_prepare_params(params))
 
     async def close(self):
         """Close HTTP client"""
-        await self.client.aclose()
+        if self.client is not None and not self.client.is_closed:
+            await self.client.aclose()
+        self.client = None
 
 # Global client instance
-client = FathomClient()
\ No newline at end of file
+client = FathomClient()
+
+
+def _close_client_at_exit():
+    """Safety net for shutdowns where the server lifespan never ran its cleanup"""
+    if client.client is None or client.client.is_closed:
+        return
+    try:
+        asyncio.run(client.close())
+    except Exception:
+        # Best effort only: the interpreter is exiting and the original loop may be gone
+        pass
+
+
+atexit.register(_close_client_at_exit)
@@ -0,0 +1,107 @@
+from contextlib import asynccontextmanager
+from typing import Mapping, Optional
+import asyncio
+import time
+
+
+def _parse_number(value: Optional[str]) -> Optional[float]:
+    """Parse a numeric header value, returning None if missing or malformed."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """Client-side token bucket kept in sync with the API's RateLimit-* headers.
+
+    Tokens mirror RateLimit-Remaining and are spent locally on every request,
+    so concurrent calls don't all fire on the same stale count. When the bucket
+    runs low, requests are spread over the rest of the window instead of
+    hitting a 429.
+
+    Concurrency adapts AIMD-style: each successful response adds
+    increase / concurrency slots (about +increase per round of requests),
+    and each 429 or 5xx multiplies the limit by decrease.
+    """
+
+    def __init__(
+        self,
+        initial_concurrency: float = 4,
+        min_concurrency: float = 1,
+        max_concurrency: float = 16,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        low_watermark: float = 0.1,
+    ):
+        self.concurrency = initial_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.increase = increase
+        self.decrease = decrease
+        self.low_watermark = low_watermark
+        self._in_flight = 0
+        self._slots = asyncio.Condition()
+        self._lock = asyncio.Lock()
+        self.limit: Optional[float] = None
+        self.tokens: Optional[float] = None
+        self.reset_at: float = 0.0
+
+    @asynccontextmanager
+    async def acquire(self):
+        """Wait for a concurrency slot and a token before sending a request."""
+        async with self._slots:
+            await self._slots.wait_for(lambda: self._in_flight < int(self.concurrency))
+            self._in_flight += 1
+        try:
+            await self._take_token()
+            yield
+        finally:
+            async with self._slots:
+                self._in_flight -= 1
+                self._slots.notify_all()
+
+    def record_result(self, success: bool) -> None:
+        """Grow concurrency additively on success, shrink it multiplicatively on overload."""
+        if success:
+            self.concurrency = min(self.max_concurrency, self.concurrency + self.increase / self.concurrency)
+        else:
+            self.concurrency = max(self.min_concurrency, self.concurrency * self.decrease)
+
+    async def _take_token(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now >= self.reset_at:
+                    # Window expired: don't throttle until the next response resyncs us
+                    self.tokens = None
+                if self.tokens is None:
+                    break
+                if self.tokens >= 1:
+                    if self.limit and self.tokens < self.limit * self.low_watermark:
+                        # Running low: pace the remaining tokens over the rest of the window
+                        await asyncio.sleep((self.reset_at - now) / self.tokens)
+                    break
+                await asyncio.sleep(self.reset_at - now)
+
+            if self.tokens is not None:
+                self.tokens -= 1
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Resync the bucket from RateLimit-Limit/Remaining/Reset response headers."""
+        limit = _parse_number(headers.get("RateLimit-Limit"))
+        remaining = _parse_number(headers.get("RateLimit-Remaining"))
+        reset = _parse_number(headers.get("RateLimit-Reset"))
+
+        if limit is not None:
+            self.limit = limit
+        if remaining is not None:
+            self.tokens = remaining
+        if reset is not None:
+            self.reset_at = time.monotonic() + reset
+
+    def retry_after(self) -> float:
+        """Seconds until the current rate limit window resets."""
+        return max(0.0, self.reset_at - time.monotonic())
@@ -1,20 +1,25 @@
-import json
+import orjson
 
 from fastmcp import FastMCP, Context
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 from typing import Any, Dict, Annotated
-from pydantic import Field
+from pydantic import BaseModel, ConfigDict, Field
 from config import config
+from cache import TTLCache
 from fathom_client import client
 from contextlib import asynccontextmanager
-from toon import encode as toon_encode
 
-# Import tools
-import tools.meetings
-import tools.recordings
-import tools.teams
-import tools.team_members
-import tools.search
+# TOON encoder and tool modules are imported on first use to keep startup fast
+_toon_encode = None
+
+
+def toon_encode(data: Any) -> str:
+    """Encode data as TOON, importing the toon package on first call."""
+    global _toon_encode
+    if _toon_encode is None:
+        from toon import encode
+        _toon_encode = encode
+    return _toon_encode(data)
 
 
 @asynccontextmanager
@@ -30,6 +35,37 @@ async def lifespan(server):
     await client.close()
 
 
+# Responses larger than this are encoded directly rather than kept in the TOON cache
+_TOON_CACHE_MAX_CHARS = 64 * 1024
+
+
+_toon_cache = TTLCache(maxsize=256, ttl=float("inf"))
+
+
+def _toon_supported(text: str) -> bool:
+    """Cheap pre-flight: only JSON objects and arrays are worth TOON-encoding."""
+    stripped = text.lstrip()
+    return bool(stripped) and stripped[0] in "{["
+
+
+def _encode_toon(text: str, data: Any = None) -> str:
+    """Encode a JSON tool response as TOON, reusing results for repeated identical responses.
+
+    When the decoded data is already at hand (the tool's structured content), it is
+    encoded directly instead of re-parsing the JSON text FastMCP just produced.
+    """
+    cacheable = len(text) <= _TOON_CACHE_MAX_CHARS
+    if cacheable:
+        cached = _toon_cache.get(text)
+        if cached is not None:
+            return cached
+
+    encoded = toon_encode(data if data is not None else orjson.loads(text))
+    if cacheable:
+        _toon_cache.set(text, encoded)
+    return encoded
+
+
 class OutputSerializationMiddleware(Middleware):
     """Serialize tool output based on OUTPUT_FORMAT configuration.
 
@@ -39,37 +75,53 @@ class OutputSerializationMiddleware(Middleware):
     async def on_call_tool(self, context: MiddlewareContext, call_next):
         result = await call_next(context)
 
+        if config.output_format not in ("toon", "hybrid"):
+            return result
+
         if result and hasattr(result, "content"):
+            # A dict result is serialized by FastMCP as a single text item mirroring
+            # structured_content, so that dict can be encoded without re-parsing the text
+            data = getattr(result, "structured_content", None)
+            if not isinstance(data, dict) or len(result.content) != 1:
+                data = None
+
             for item in result.content:
                 if hasattr(item, "text"):
                     text = item.text
-                    if text and isinstance(text, str):
+                    if text and isinstance(text, str) and _toon_supported(text):
                         try:
-                            parsed = json.loads(text)
-                            if config.output_format in ("toon", "hybrid"):
-                                try:
-                                    item.text = toon_encode(parsed)
-                                    if config.output_format == "toon":
-                                        result.structured_content = {"toon": item.text}
-                                except Exception:
-                                    pass
-                        except (json.JSONDecodeError, TypeError, ValueError):
-                            pass
+                            item.text = _encode_toon(text, data)
+                            if config.output_format == "toon":
+                                result.structured_content = {"toon": item.text}
+                        except (orjson.JSONDecodeError, TypeError, ValueError, RecursionError) as e:
+                            # Not valid JSON or not encodable as TOON: keep the original text.
+                            # python-toon's encode() raises nothing of its own (unknown values
+                            # become null), but deeply nested data overflows its recursion.
+                            ctx = context.fastmcp_context
+                            if config.debug_logging and ctx is not None:
+                                await ctx.debug(
+                                    f"TOON encoding failed ({type(e).__name__}: {e}); returning JSON"
+                                )
 
         return result
 
 
+_INSTRUCTIONS = " ".join((
+    "Access Fathom.video meeting recordings, transcripts, summaries, teams, and team members.",
+    "Fathom.video automatically records, transcribes, and summarizes meetings.",
+    "Use search_meetings to find meetings by keywords in titles, summaries, participants, teams, and topics.",
+    "Use list_meetings to browse meetings with filtering by date, attendees, teams, and domains.",
+    "Use get_meeting_details for comprehensive meeting data including summaries.",
+    "Use list_teams and list_team_members for organizational data.",
+    "All endpoints support pagination and efficient data retrieval optimized for LLM processing.",
+))
+
+_PER_PAGE_DESC = f"Number of results per page (default: {config.default_per_page})"
+
+
 mcp = FastMCP(
     name="Fathom MCP Server",
-    instructions=(
-        "Access Fathom.video meeting recordings, transcripts, summaries, teams, and team members."
-        "Fathom.video automatically records, transcribes, and summarizes meetings."
-        "Use search_meetings to find meetings by keywords in titles, summaries, participants, teams, and topics."
-        "Use list_meetings to browse meetings with filtering by date, attendees, teams, and domains."
-        "Use get_meeting_details for comprehensive meeting data including summaries."
-        "Use list_teams and list_team_members for organizational data."
-        "All endpoints support pagination and efficient data retrieval optimized for LLM processing."
-    ),
+    instructions=_INSTRUCTIONS,
     version="0.1.0",
     lifespan=lifespan,
     on_duplicate="warn",
@@ -90,7 +142,13 @@ async def search_meetings(
     query: Annotated[
         str,
         Field(
-            description="Search query to match against meeting metadata (titles, participants, teams, topics, summaries, and optionally transcripts)"
+            description=(
+                "Search query to match against meeting metadata (titles, participants, teams, topics, "
+                "summaries, and optionally transcripts). Matching ignores case, spaces, hyphens and "
+                "underscores. A multi-word query also matches when all of its significant words "
+                "(3+ characters, not stop words) appear in the same field, e.g. one title or one "
+                "transcript turn"
+            )
         ),
     ],
     include_transcript: Annotated[
@@ -99,6 +157,13 @@ async def search_meetings(
             description="If True, search within transcripts and include them in results."
         ),
     ] = False,
+    max_matches: Annotated[
+        int,
+        Field(
+            description="Stop searching once this many meetings have matched (default: 50)",
+            ge=1,
+        ),
+    ] = 50,
 ) -> Dict[str, Any]:
     """Search meetings by keyword across metadata fields and optionally transcripts.
 
@@ -108,14 +173,37 @@ async def search_meetings(
     By default, transcripts are NOT searched or included to optimize performance. Set include_transcript=True
     to search within and return transcript data.
 
-    Fetches all meetings (with pagination) and returns those matching the search query.
+    Fetches meetings page by page and returns those matching the search query, stopping early
+    once max_matches meetings have matched.
 
     Examples:
         search_meetings("McDonalds")  # Search metadata only
         search_meetings("budget discussion", include_transcript=True)  # Search including transcripts
         search_meetings("engineering")  # Find meetings related to engineering
     """
-    return await tools.search.search_meetings(ctx, query, include_transcript)
+    import tools.search
+    return await tools.search.search_meetings(ctx, query, include_transcript, max_matches)
+
+
+class ListMeetingsParams(BaseModel):
+    """Filters and pagination options for list_meetings."""
+
+    # Frozen so the shared default instance can't be mutated between calls
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    calendar_invitees: list[str] | None = Field(default=None, description="Filter by invitee emails")
+    calendar_invitees_domains: list[str] | None = Field(default=None, description="Filter by domains")
+    created_after: str | None = Field(default=None, description="ISO timestamp filter")
+    created_before: str | None = Field(default=None, description="ISO timestamp filter")
+    cursor: str | None = Field(default=None, description="Pagination cursor")
+    include_action_items: bool | None = Field(default=None, description="Include action items")
+    include_crm_matches: bool | None = Field(default=None, description="Include CRM matches")
+    per_page: int = Field(
+        default=config.default_per_page,
+        description=_PER_PAGE_DESC,
+    )
+    recorded_by: list[str] | None = Field(default=None, description="Filter by recorder emails")
+    teams: list[str] | None = Field(default=None, description="Filter by team names")
 
 
 @mcp.tool(
@@ -125,60 +213,21 @@ async def search_meetings(
 )
 async def list_meetings(
     ctx: Context,
-    calendar_invitees: Annotated[
-        list[str], Field(description="Filter by invitee emails")
-    ] = None,
-    calendar_invitees_domains: Annotated[
-        list[str], Field(description="Filter by domains")
-    ] = None,
-    created_after: Annotated[
-        str, Field(description="ISO timestamp filter")
-    ] = None,
-    created_before: Annotated[
-        str, Field(description="ISO timestamp filter")
-    ] = None,
-    cursor: Annotated[
-        str, Field(description="Pagination cursor")
-    ] = None,
-    include_action_items: Annotated[
-        bool, Field(description="Include action items")
-    ] = None,
-    include_crm_matches: Annotated[
-        bool, Field(description="Include CRM matches")
-    ] = None,
-    per_page: Annotated[
-        int,
-        Field(description=f"Number of results per page (default: {config.default_per_page})"),
-    ] = config.default_per_page,
-    recorded_by: Annotated[
-        list[str], Field(description="Filter by recorder emails")
-    ] = None,
-    teams: Annotated[
-        list[str], Field(description="Filter by team names")
-    ] = None,
+    params: Annotated[
+        ListMeetingsParams, Field(description="Meeting filters and pagination options")
+    ] = ListMeetingsParams(),
 ) -> Dict[str, Any]:
     """Retrieve paginated meetings with filtering and optional content inclusion (action items, CRM matches).
 
     Examples:
         list_meetings()  # Get all meetings (paginated)
-        list_meetings(created_after="2024-01-01T00:00:00Z")  # Meetings after specific date
-        list_meetings(teams=["Sales", "Engineering"])  # Filter by specific teams
-        list_meetings(calendar_invitees=["john.doe@company.com", "jane.smith@client.com"])  # Filter by specific attendees
-        list_meetings(calendar_invitees_domains=["company.com", "client.com"])  # Filter by attendee domains
+        list_meetings(params={"created_after": "2024-01-01T00:00:00Z"})  # Meetings after specific date
+        list_meetings(params={"teams": ["Sales", "Engineering"]})  # Filter by specific teams
+        list_meetings(params={"calendar_invitees": ["john.doe@company.com", "jane.smith@client.com"]})  # Filter by specific attendees
+        list_meetings(params={"calendar_invitees_domains": ["company.com", "client.com"]})  # Filter by attendee domains
     """
-    return await tools.meetings.list_meetings(
-        ctx,
-        calendar_invitees=calendar_invitees,
-        calendar_invitees_domains=calendar_invitees_domains,
-        created_after=created_after,
-        created_before=created_before,
-        cursor=cursor,
-        include_action_items=include_action_items,
-        include_crm_matches=include_crm_matches,
-        per_page=per_page,
-        recorded_by=recorded_by,
-        teams=teams
-    )
+    import tools.meetings
+    return await tools.meetings.list_meetings(ctx, **params.model_dump(exclude_none=True))
 
 
 @mcp.tool(
@@ -189,13 +238,22 @@ async def list_meetings(
 async def get_meeting_details(
     ctx: Context,
     recording_id: Annotated[int, Field(description="The recording identifier")],
+    include_summary: Annotated[
+        bool,
+        Field(description="Include the AI summary. Set False for a faster metadata-only lookup."),
+    ] = True,
 ) -> Dict[str, Any]:
     """Retrieve comprehensive meeting details including summary and metadata (without transcript).
 
-    Example:
+    Pass include_summary=False when only metadata (title, participants, dates, teams) is needed;
+    it skips the summary request entirely.
+
+    Examples:
         get_meeting_details([recording_id])
+        get_meeting_details([recording_id], include_summary=False)  # Metadata only
     """
-    return await tools.recordings.get_meeting_details(ctx, recording_id)
+    import tools.recordings
+    return await tools.recordings.get_meeting_details(ctx, recording_id, include_summary)
 
 
 @mcp.tool(
@@ -212,6 +270,7 @@ async def get_meeting_transcript(
     Example:
         get_meeting_transcript([recording_id])
     """
+    import tools.recordings
     return await tools.recordings.get_meeting_transcript(ctx, recording_id)
 
 
@@ -226,7 +285,7 @@ async def list_teams(
         str, Field(description="Pagination cursor")
     ] = None,
     per_page: Annotated[
-        int, Field(description=f"Number of results per page (default: {config.default_per_page})")
+        int, Field(description=_PER_PAGE_DESC)
     ] = None,
 ) -> Dict[str, Any]:
     """Retrieve paginated list of teams with organizational structure.
@@ -235,6 +294,7 @@ async def list_teams(
         list_teams_tool()  # Get first page of teams
         list_teams_tool(cursor="abc123")  # Get next page using cursor
     """
+    import tools.teams
     return await tools.teams.list_teams(ctx, cursor, per_page)
 
 
@@ -249,7 +309,7 @@ async def list_team_members(
         str, Field(description="Pagination cursor")
     ] = None,
     per_page: Annotated[
-        int, Field(description=f"Number of results per page (default: {config.default_per_page})")
+        int, Field(description=_PER_PAGE_DESC)
     ] = None,
     team: Annotated[
         str, Field(description="Filter by team name")
@@ -262,6 +322,7 @@ async def list_team_members(
         list_team_members_tool(team="Engineering")  # Filter members by team name
         list_team_members_tool(cursor="def456")  # Paginate through member list
     """
+    import tools.team_members
     return await tools.team_members.list_team_members(ctx, cursor, team, per_page)
 
 
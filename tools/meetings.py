@@ -5,42 +5,37 @@ from config import config
 from utils import filter_response
 
 
-def _build_meetings_params(
-    calendar_invitees: Optional[List[str]] = None,
-    calendar_invitees_domains: Optional[List[str]] = None,
-    created_after: Optional[str] = None,
-    created_before: Optional[str] = None,
-    cursor: Optional[str] = None,
-    include_action_items: Optional[bool] = None,
-    include_crm_matches: Optional[bool] = None,
-    recorded_by: Optional[List[str]] = None,
-    teams: Optional[List[str]] = None,
-    per_page: Optional[int] = None
-) -> dict:
-    """Build API parameters dict from function arguments"""
-    params = {}
-    
-    if calendar_invitees:
-        params["calendar_invitees[]"] = calendar_invitees
-    if calendar_invitees_domains:
-        params["calendar_invitees_domains[]"] = calendar_invitees_domains
-    if created_after:
-        params["created_after"] = created_after
-    if created_before:
-        params["created_before"] = created_before
-    if cursor:
-        params["cursor"] = cursor
-    if include_action_items is not None:
-        params["include_action_items"] = include_action_items
-    if include_crm_matches is not None:
-        params["include_crm_matches"] = include_crm_matches
-    if recorded_by:
-        params["recorded_by[]"] = recorded_by
-    if teams:
-        params["teams[]"] = teams
-    if per_page is not None:
-        params["limit"] = per_page
-    
+def _is_set(value) -> bool:
+    """Predicate for flags and numbers, where False and 0 are meaningful values"""
+    return value is not None
+
+
+# (argument name, API parameter name, predicate deciding whether to send it)
+_PARAM_SPEC = (
+    ("calendar_invitees", "calendar_invitees[]", bool),
+    ("calendar_invitees_domains", "calendar_invitees_domains[]", bool),
+    ("created_after", "created_after", bool),
+    ("created_before", "created_before", bool),
+    ("cursor", "cursor", bool),
+    ("include_action_items", "include_action_items", _is_set),
+    ("include_crm_matches", "include_crm_matches", _is_set),
+    ("recorded_by", "recorded_by[]", bool),
+    ("teams", "teams[]", bool),
+)
+
+# Parameters for the common no-filter, default-page-size call, built once and never mutated
+_DEFAULT_PARAMS = {"limit": config.default_per_page}
+
+
+def _build_meetings_params(**kwargs) -> Optional[dict]:
+    """Build API filter parameters from list_meetings keyword arguments, or None if no filter is set"""
+    params = None
+    for arg_name, api_key, predicate in _PARAM_SPEC:
+        value = kwargs.get(arg_name)
+        if predicate(value):
+            if params is None:
+                params = {}
+            params[api_key] = value
     return params
 
 async def list_meetings(
@@ -84,10 +79,7 @@ async def list_meetings(
     try:
         await ctx.info("Fetching meetings from Fathom API")
 
-        # Use config default if per_page not provided
-        effective_per_page = per_page if per_page is not None else config.default_per_page
-
-        # Build parameters
+        # Build filter parameters
         params = _build_meetings_params(
             calendar_invitees=calendar_invitees,
             calendar_invitees_domains=calendar_invitees_domains,
@@ -97,11 +89,17 @@ async def list_meetings(
             include_action_items=include_action_items,
             include_crm_matches=include_crm_matches,
             recorded_by=recorded_by,
-            teams=teams,
-            per_page=effective_per_page
+            teams=teams
         )
 
-        result = await client.get_meetings(params=params if params else None)
+        if params is None and per_page is None:
+            params = _DEFAULT_PARAMS
+        else:
+            # Use config default if per_page not provided
+            params = params or {}
+            params["limit"] = per_page if per_page is not None else config.default_per_page
+
+        result = await client.get_meetings(params=params)
         await ctx.info("Successfully retrieved meetings")
 
         return filter_response(result)
@@ -1,20 +1,68 @@
 from fastmcp import Context
 from typing import Optional
 from fathom_client import client, FathomAPIError
+from cache import AsyncTTLCache
+from config import config
 from utils import filter_response
 import asyncio
 import strip_markdown
 
+# (output key, meeting field) pairs for get_meeting_details, in output order
+_DETAIL_FIELDS = (
+    ("title", "title"),
+    ("meeting_url", "url"),
+    ("share_url", "share_url"),
+    ("created_at", "created_at"),
+    ("scheduled_start_time", "scheduled_start_time"),
+    ("scheduled_end_time", "scheduled_end_time"),
+    ("recording_start_time", "recording_start_time"),
+    ("recording_end_time", "recording_end_time"),
+    ("transcript_language", "transcript_language"),
+    ("participants", "participants"),
+    ("recorded_by", "recorded_by"),
+    ("teams", "teams"),
+    ("topics", "topics"),
+    ("sentiment", "sentiment"),
+    ("crm_matches", "crm_matches"),
+)
+
+# Meeting fields returned alongside a transcript
+_TRANSCRIPT_META_FIELDS = (
+    "title",
+    "participants",
+    "created_at",
+    "scheduled_start_time",
+    "scheduled_end_time",
+)
+
+# Plain-text summaries by recording_id; summaries don't change once generated
+_plain_summary_cache = AsyncTTLCache(maxsize=config.cache_size)
+
+
+async def _plain_text_summary(recording_id: int, markdown_summary: str) -> str:
+    """Convert a markdown summary to plain text in a worker thread, caching the result."""
+    if not markdown_summary:
+        return ""
+    return await _plain_summary_cache.fetch_with_swr(
+        recording_id,
+        config.recording_cache_ttl,
+        config.cache_stale_ttl,
+        lambda: asyncio.to_thread(strip_markdown.strip_markdown, markdown_summary)
+    )
+
 
 async def get_meeting_details(
     ctx: Context,
-    recording_id: int
+    recording_id: int,
+    include_summary: bool = True
 ) -> dict:
     """Retrieve comprehensive meeting details including summary and metadata (without transcript).
 
     Args:
         ctx: MCP context for logging
         recording_id: Numeric ID of the recording
+        include_summary: Set False to return metadata only, skipping the summary request
+            and markdown conversion (default: True)
 
     Returns:
         dict: Unified meeting object with metadata and summary (no transcript)
@@ -22,54 +70,43 @@ async def get_meeting_details(
     try:
         await ctx.info(f"Fetching meeting details for recording {recording_id}")
 
-        # Fetch meeting metadata and summary concurrently
-        meeting_task = client.get_meeting(recording_id)
-        summary_task = client.get_summary(recording_id)
-
-        meeting, summary = await asyncio.gather(
-            meeting_task, summary_task, return_exceptions=True
-        )
-
-        # If summary (primary payload) failed, propagate the error
-        if isinstance(summary, Exception):
-            raise summary
-
-        # Meeting metadata is best-effort: older recordings or those
-        # recorded by others may not appear on the first page of /meetings.
-        if isinstance(meeting, FathomAPIError):
-            await ctx.info(
-                f"Meeting metadata unavailable for recording {recording_id} "
-                f"({type(meeting).__name__} status={meeting.status_code}); "
-                f"returning summary without full metadata"
+        if not include_summary:
+            # Metadata is the only payload, so a lookup failure propagates
+            meeting = await client.get_meeting(recording_id)
+            plain_text_summary = None
+        else:
+            # Fetch meeting metadata and summary concurrently
+            meeting_task = client.get_meeting(recording_id)
+            summary_task = client.get_summary(recording_id)
+
+            meeting, summary = await asyncio.gather(
+                meeting_task, summary_task, return_exceptions=True
             )
-            meeting = {}
-        elif isinstance(meeting, Exception):
-            raise meeting
 
-        # Convert markdown summary to plain text
-        markdown_summary = summary.get("summary", {}).get("markdown_formatted", "")
-        plain_text_summary = strip_markdown.strip_markdown(markdown_summary) if markdown_summary else ""
+            # If summary (primary payload) failed, propagate the error
+            if isinstance(summary, Exception):
+                raise summary
+
+            # Meeting metadata is best-effort: recordings made by others may
+            # not be listed in /meetings for this API key.
+            if isinstance(meeting, FathomAPIError):
+                await ctx.info(
+                    f"Meeting metadata unavailable for recording {recording_id} "
+                    f"({type(meeting).__name__} status={meeting.status_code}); "
+                    f"returning summary without full metadata"
+                )
+                meeting = {}
+            elif isinstance(meeting, Exception):
+                raise meeting
+
+            # Convert markdown summary to plain text
+            markdown_summary = summary.get("summary", {}).get("markdown_formatted", "")
+            plain_text_summary = await _plain_text_summary(recording_id, markdown_summary)
 
         # Build unified meeting object without transcript
-        result = {
-            "recording_id": recording_id,
-            "title": meeting.get("title"),
-            "meeting_url": meeting.get("url"),
-            "share_url": meeting.get("share_url"),
-            "created_at": meeting.get("created_at"),
-            "scheduled_start_time": meeting.get("scheduled_start_time"),
-            "scheduled_end_time": meeting.get("scheduled_end_time"),
-            "recording_start_time": meeting.get("recording_start_time"),
-            "recording_end_time": meeting.get("recording_end_time"),
-            "transcript_language": meeting.get("transcript_language"),
-            "participants": meeting.get("participants", []),
-            "recorded_by": meeting.get("recorded_by"),
-            "teams": meeting.get("teams", []),
-            "topics": meeting.get("topics", []),
-            "sentiment": meeting.get("sentiment"),
-            "crm_matches": meeting.get("crm_matches", []),
-            "summary": plain_text_summary
-        }
+        result = {"recording_id": recording_id}
+        result.update((key, meeting.get(source)) for key, source in _DETAIL_FIELDS)
+        result["summary"] = plain_text_summary
 
         await ctx.info("Successfully retrieved meeting details")
         return filter_response(result)
@@ -110,8 +147,8 @@ async def get_meeting_transcript(
         if isinstance(transcript, Exception):
             raise transcript
 
-        # Meeting metadata is best-effort: older recordings or those
-        # recorded by others may not appear on the first page of /meetings.
+        # Meeting metadata is best-effort: recordings made by others may
+        # not be listed in /meetings for this API key.
         if isinstance(meeting, FathomAPIError):
             await ctx.info(
                 f"Meeting metadata unavailable for recording {recording_id} "
@@ -123,15 +160,9 @@ async def get_meeting_transcript(
             raise meeting
         
         # Build transcript object with essential metadata
-        result = {
-            "recording_id": recording_id,
-            "title": meeting.get("title"),
-            "participants": meeting.get("participants", []),
-            "created_at": meeting.get("created_at"),
-            "scheduled_start_time": meeting.get("scheduled_start_time"),
-            "scheduled_end_time": meeting.get("scheduled_end_time"),
-            "transcript": transcript.get("transcript", [])
-        }
+        result = {"recording_id": recording_id}
+        result.update((key, meeting.get(key)) for key in _TRANSCRIPT_META_FIELDS)
+        result["transcript"] = transcript.get("transcript", [])
 
         await ctx.info("Successfully retrieved meeting transcript")
         return filter_response(result)
@@ -1,18 +1,60 @@
 from fastmcp import Context
 from fathom_client import client, FathomAPIError
+from cache import TTLCache
+from config import config
 from utils import filter_response
-from typing import Optional
+from contextlib import aclosing
+from typing import AsyncIterator, Dict, List, Tuple
+import asyncio
+import bisect
+import functools
 
 
-def _normalize_search(text: str) -> str:
+# Removes spaces, hyphens and underscores in a single translate() pass
+_DROP_TABLE = str.maketrans("", "", " -_")
+
+
+def _normalize_text(text: str) -> str:
     """Normalize text for fuzzy matching: lowercase, remove spaces/hyphens, strip trailing 's'."""
-    normalized = text.lower().replace(" ", "").replace("-", "").replace("_", "")
+    return _normalize_lowered(text.lower())
+
+
+def _normalize_lowered(lowered: str) -> str:
+    """Finish normalizing text that has already been lowercased."""
+    normalized = lowered.translate(_DROP_TABLE)
     # Strip trailing 's' to handle simple plurals (labs -> lab, meetings -> meeting)
-    if normalized.endswith("s") and len(normalized) > 2:
+    if len(normalized) > 2 and normalized[-1] == "s":
         normalized = normalized[:-1]
     return normalized
 
 
+# Titles, names, teams and topics recur across meetings, so memoize their normalization.
+# Summaries and transcripts go through _normalize_text directly to keep them out of the LRU.
+@functools.lru_cache(maxsize=100_000)
+def _normalize_search(text: str) -> str:
+    """Memoized _normalize_text for short, frequently repeated metadata strings."""
+    return _normalize_text(text)
+
+
+# Meeting fields returned in search results, in output order (summary is added separately)
+_MEETING_FIELDS = (
+    "title",
+    "recording_id",
+    "url",
+    "share_url",
+    "created_at",
+    "scheduled_start_time",
+    "scheduled_end_time",
+    "recording_start_time",
+    "recording_end_time",
+    "transcript_language",
+    "calendar_invitees",
+    "recorded_by",
+    "teams",
+    "topics",
+)
+
+
 def _filter_meeting_fields(meeting: dict, found_in_transcript: bool = False) -> dict:
     """Filter and structure meeting fields for search results.
     
@@ -30,113 +72,342 @@ def _filter_meeting_fields(meeting: dict, found_in_transcript: bool = False) ->
     elif isinstance(summary, str):
         summary_text = summary
     
-    result = {
-        "title": meeting.get("title"),
-        "recording_id": meeting.get("recording_id"),
-        "url": meeting.get("url"),
-        "share_url": meeting.get("share_url"),
-        "created_at": meeting.get("created_at"),
-        "scheduled_start_time": meeting.get("scheduled_start_time"),
-        "scheduled_end_time": meeting.get("scheduled_end_time"),
-        "recording_start_time": meeting.get("recording_start_time"),
-        "recording_end_time": meeting.get("recording_end_time"),
-        "transcript_language": meeting.get("transcript_language"),
-        "calendar_invitees": meeting.get("calendar_invitees"),
-        "recorded_by": meeting.get("recorded_by"),
-        "teams": meeting.get("teams"),
-        "topics": meeting.get("topics"),
-        "summary": summary_text
-    }
+    result = {field: meeting.get(field) for field in _MEETING_FIELDS}
+    result["summary"] = summary_text
     
     # Add flag indicating if match was found in transcript
     if found_in_transcript:
         result["found_in_transcript"] = True
-    
+
     return result
 
 
-def _meeting_matches_search(meeting: dict, search_normalized: str) -> tuple:
-    """Check if a meeting matches the search term in title, attendees, or teams.
-    
-    Returns:
-        tuple: (matches, found_in_transcript) - matches=True if found, found_in_transcript=False for metadata searches
-    """
-    
-    # Check title
-    title = _normalize_search(meeting.get("title") or "")
-    if search_normalized in title:
-        return True, False
+# Searches stop fetching pages once this many meetings have matched
+DEFAULT_MAX_MATCHES = 50
 
-    # Check meeting_title
-    meeting_title = _normalize_search(meeting.get("meeting_title") or "")
-    if search_normalized in meeting_title:
-        return True, False
+# Upper bound on meetings scanned by one search
+MAX_MEETINGS_SEARCHED = 500
 
-    # Check attendee names and emails
-    for invitee in meeting.get("calendar_invitees") or []:
-        name = _normalize_search(invitee.get("name") or "")
-        email = (invitee.get("email") or "").lower()
-        if search_normalized in name or search_normalized in email:
-            return True, False
-
-    # Check team names
-    for team in meeting.get("teams") or []:
-        team_name = _normalize_search(team.get("name") or "") if isinstance(team, dict) else _normalize_search(str(team))
-        if search_normalized in team_name:
-            return True, False
-
-    # Check topics
-    for topic in meeting.get("topics") or []:
-        topic_text = _normalize_search(topic.get("name") or "") if isinstance(topic, dict) else _normalize_search(str(topic))
-        if search_normalized in topic_text:
-            return True, False
-
-    # Check default_summary.markdown_formatted (summary)
+# Joins normalized fields so a query can never match across two of them
+_FIELD_SEPARATOR = "\x00"
+
+# (raw searchable source, normalized haystack) by recording_id, so repeat searches skip
+# normalization while the meeting's searchable fields are unchanged
+_haystack_cache = TTLCache(maxsize=config.cache_size, ttl=config.cache_ttl)
+
+
+def _summary_markdown(meeting: dict) -> str:
+    """Return a meeting's markdown summary, or "" when it has none."""
     summary = meeting.get("default_summary")
-    summary_text = None
+    if isinstance(summary, dict) and summary.get("markdown_formatted"):
+        return str(summary["markdown_formatted"])
+    return ""
 
-    if isinstance(summary, dict):
-        summary_text = summary.get("markdown_formatted")
 
-    if summary_text:
-        summary_text_norm = _normalize_search(str(summary_text))
-        if search_normalized in summary_text_norm:
-            return True, False
+def _searchable_source(meeting: dict) -> tuple:
+    """Collect the raw strings search reads from a meeting, grouped by how they're normalized.
 
-    return False, False
+    Returns (names, emails, summary markdown): names covers title, meeting_title, attendee
+    names, team names and topics; emails are only lowercased so their punctuation stays
+    intact. The tuple doubles as the memo key check in _build_haystack.
+    """
+    names = [meeting.get("title") or "", meeting.get("meeting_title") or ""]
+    emails = []
+    for invitee in meeting.get("calendar_invitees") or []:
+        names.append(invitee.get("name") or "")
+        emails.append(invitee.get("email") or "")
 
+    for group in (meeting.get("teams") or [], meeting.get("topics") or []):
+        for entry in group:
+            names.append((entry.get("name") or "") if isinstance(entry, dict) else str(entry))
 
-def _meeting_matches_search_with_transcript(meeting: dict, search_normalized: str) -> tuple:
-    """Check if a meeting matches the search term including transcript text.
-    
-    Returns:
-        tuple: (matches, found_in_transcript) - found_in_transcript=True if match is in transcript
+    return tuple(names), tuple(emails), _summary_markdown(meeting)
+
+
+def _build_haystack(meeting: dict) -> str:
+    """Build one normalized string from a meeting's searchable metadata and summary.
+
+    A search is then a single substring scan per meeting. The result is memoized by
+    recording_id and reused only while every searchable field is unchanged, so edits to
+    the title, attendees, teams, topics or summary are picked up on the next search.
     """
-    # First check all metadata fields
-    matches, _ = _meeting_matches_search(meeting, search_normalized)
-    if matches:
-        return True, False
-    
-    # Check transcript
-    transcript = meeting.get("transcript")
-    if transcript:
-        if isinstance(transcript, list):
-            for entry in transcript:
-                if isinstance(entry, dict):
-                    text = entry.get("text", "")
-                    if search_normalized in _normalize_search(text):
-                        return True, True
-        elif isinstance(transcript, str):
-            if search_normalized in _normalize_search(transcript):
-                return True, True
-    
-    return False, False
+    recording_id = meeting.get("recording_id")
+    source = _searchable_source(meeting)
+    if recording_id is not None:
+        cached = _haystack_cache.get(recording_id)
+        # Unchanged fields are usually the very same string objects, so this is mostly
+        # identity checks
+        if cached is not None and cached[0] == source:
+            return cached[1]
+
+    names, emails, markdown = source
+    fields = [_normalize_search(name) for name in names]
+    fields.extend(email.lower() for email in emails)
+    if markdown:
+        fields.append(_normalize_text(markdown))
+
+    haystack = _FIELD_SEPARATOR.join(fields)
+    if recording_id is not None:
+        _haystack_cache.set(recording_id, (source, haystack))
+    return haystack
+
+
+# Query words too short or too common to narrow a search on their own; they are
+# still part of the phrase match
+_MIN_TERM_LENGTH = 3
+_STOP_WORDS = frozenset({
+    "a", "an", "and", "are", "at", "by", "for", "from", "in", "is", "of", "on",
+    "or", "the", "to", "was", "with",
+})
+
+
+def _search_terms(query: str) -> tuple:
+    """Split a multi-word query into its distinct significant normalized terms.
+
+    Stop words and terms shorter than _MIN_TERM_LENGTH are dropped, and fewer than
+    two remaining terms yield (), leaving only the phrase match.
+    """
+    terms = tuple(dict.fromkeys(
+        t for t in (_normalize_search(w) for w in query.split() if w.lower() not in _STOP_WORDS)
+        if len(t) >= _MIN_TERM_LENGTH
+    ))
+    return terms if len(terms) > 1 else ()
+
+
+def _terms_in_one_field(haystack: str, search_terms: tuple) -> bool:
+    """True if a single _FIELD_SEPARATOR-delimited field of haystack contains every term."""
+    # Cheap rejection before splitting: every term must at least be somewhere
+    if not all(term in haystack for term in search_terms):
+        return False
+    return any(
+        all(term in field for term in search_terms)
+        for field in haystack.split(_FIELD_SEPARATOR)
+    )
+
+
+def _text_matches(haystack: str, search_normalized: str, search_terms: tuple = ()) -> bool:
+    """Match the whole normalized query, or for multi-word queries every term in one field."""
+    if search_normalized in haystack:
+        return True
+    return bool(search_terms) and _terms_in_one_field(haystack, search_terms)
+
+
+def _transcript_matches(
+    transcript, search_normalized: str, search_terms: tuple = (), query_lower: str = ""
+) -> bool:
+    """Check if the search term appears in a transcript (a list of turns or plain text).
+
+    Transcript entries are joined (with a separator no query can span) and lowercased
+    once, so the whole transcript is matched with a couple of C-level substring scans
+    instead of a Python loop per entry. A plain lowercase hit on query_lower is tried
+    first; any hit there is also a normalized hit, so normalization only runs on misses.
+    """
+    if not transcript:
+        return False
+
+    if isinstance(transcript, list):
+        # One field per turn, so multi-word queries need all their terms in the same turn
+        text = _FIELD_SEPARATOR.join(
+            entry.get("text") or "" for entry in transcript if isinstance(entry, dict)
+        )
+    elif isinstance(transcript, str):
+        text = transcript
+    else:
+        return False
+
+    lowered = text.lower()
+    if query_lower and query_lower in lowered:
+        return True
+    return _text_matches(_normalize_lowered(lowered), search_normalized, search_terms)
+
+
+# Joins meeting haystacks in a _SearchIndex corpus; distinct from _FIELD_SEPARATOR
+_MEETING_SEPARATOR = "\x01"
+
+
+class _SearchIndex:
+    """Normalized metadata haystacks for a page of meetings, joined into one corpus.
+
+    A query is located with repeated str.find() over the corpus and bisect maps each
+    hit back to its meeting, so a page is scanned in one pass instead of per meeting.
+    """
+
+    __slots__ = ("_haystacks", "_starts", "_corpus")
+
+    def __init__(self, haystacks: List[str]):
+        self._haystacks = haystacks
+        starts = []
+        offset = 0
+        for haystack in self._haystacks:
+            starts.append(offset)
+            offset += len(haystack) + len(_MEETING_SEPARATOR)
+        self._starts = starts
+        self._corpus = _MEETING_SEPARATOR.join(self._haystacks)
+
+    def matching(self, search_normalized: str, search_terms: tuple = ()) -> set:
+        """Return the indexes of meetings whose metadata matches the query."""
+        if not search_normalized:
+            return set(range(len(self._haystacks)))
+
+        corpus = self._corpus
+        starts = self._starts
+        hits = set()
+        pos = corpus.find(search_normalized)
+        while pos != -1:
+            index = bisect.bisect_right(starts, pos) - 1
+            hits.add(index)
+            if index + 1 >= len(starts):
+                break
+            # Skip the rest of this meeting; one hit is enough
+            pos = corpus.find(search_normalized, starts[index + 1])
+
+        if search_terms:
+            for index, haystack in enumerate(self._haystacks):
+                if index not in hits and _terms_in_one_field(haystack, search_terms):
+                    hits.add(index)
+        return hits
+
+    def built_from(self, haystacks: List[str]) -> bool:
+        """True if this index was built from exactly these (memoized) haystacks."""
+        return len(haystacks) == len(self._haystacks) and all(
+            new is old for new, old in zip(haystacks, self._haystacks)
+        )
+
+
+# Indexes by the page's recording_ids, so repeat searches over the same page reuse them.
+# An index is reused only while every haystack it was built from is still current.
+_index_cache = TTLCache(maxsize=64, ttl=config.meetings_cache_ttl)
+
+
+def _search_index(meetings: List[dict]) -> _SearchIndex:
+    """Return the cached _SearchIndex for a page of meetings, building it on a miss."""
+    haystacks = [_build_haystack(m) for m in meetings]
+    key = tuple(m.get("recording_id") for m in meetings)
+    if None in key:
+        return _SearchIndex(haystacks)
+    index = _index_cache.get(key)
+    if index is None or not index.built_from(haystacks):
+        index = _SearchIndex(haystacks)
+        _index_cache.set(key, index)
+    return index
+
+
+async def _fetch_first_page(params: dict) -> Tuple[dict, int]:
+    """Fetch the first page of a search at the largest page size known to work for it.
+
+    Returns the response and the page size used, falling back to DEFAULT_PER_PAGE if the
+    API rejects the large page. Pages with embedded transcripts always use DEFAULT_PER_PAGE,
+    so a search that reaches max_matches early stops downloading transcripts early too.
+    """
+    if params.get("include_transcript"):
+        limit = config.default_per_page
+        return await client.get_meetings(params={**params, "limit": limit}), limit
+    return await client.get_meetings_first_page(params)
+
+
+async def _iter_meeting_pages(params: dict, max_meetings: int) -> AsyncIterator[List[dict]]:
+    """Yield pages of meetings until max_meetings have been seen, prefetching the next page
+    while the caller processes the current one.
+
+    Pages are requested at config.search_page_limit so a single request usually covers the
+    whole search, except transcript-bearing pages (see _fetch_first_page). If the server
+    returns shorter pages, pagination simply continues until
+    max_meetings have been seen.
+    The API only supports cursor pagination, so pages can't be fetched in parallel;
+    instead the request for page N+1 is in flight as soon as page N's cursor is known.
+    """
+    next_page = asyncio.create_task(_fetch_first_page(params))
+    remaining = max_meetings
+    limit = None
+    try:
+        while True:
+            response = await next_page
+            next_page = None
+            if limit is None:
+                response, limit = response
+            items = response.get("items", [])
+            if not items:
+                return
+
+            cursor = response.get("next_cursor") or response.get("cursor")
+            items = items[:remaining]
+            remaining -= len(items)
+            if cursor and remaining > 0:
+                next_page = asyncio.create_task(
+                    client.get_meetings(params={**params, "limit": limit, "cursor": cursor})
+                )
+
+            yield items
+
+            if next_page is None:
+                return
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+
+
+async def _log_debug(ctx: Context, fmt: str, *args) -> None:
+    """Send a debug log only when debug logging is enabled, formatting lazily."""
+    if config.debug_logging:
+        await ctx.debug(fmt.format(*args) if args else fmt)
+
+
+# recording_ids whose transcript fetch was refused (e.g. no access, not ready yet);
+# later searches skip them for a while instead of asking again
+_TRANSCRIPT_FAILURE_TTL = 600
+_transcript_failures = TTLCache(maxsize=config.cache_size, ttl=_TRANSCRIPT_FAILURE_TTL)
+
+
+def _is_lasting_failure(error: BaseException) -> bool:
+    """Client errors are worth remembering; rate limits, 5xx and network errors are not."""
+    status = getattr(error, "status_code", None)
+    return status is not None and 400 <= status < 500 and status != 429
+
+
+async def _fetch_transcripts(ctx: Context, meetings: List[dict]) -> Dict[int, object]:
+    """Fetch transcripts for meetings that don't already carry one, a few at a time.
+
+    Returns the transcripts by recording_id. Page items are shared with the client's page
+    cache, so they are never modified.
+    """
+    pending = [
+        m for m in meetings
+        if not m.get("transcript")
+        and m.get("recording_id")
+        and _transcript_failures.get(m["recording_id"]) is None
+    ]
+    if not pending:
+        return {}
+
+    semaphore = asyncio.Semaphore(config.transcript_concurrency)
+
+    async def fetch_one(meeting: dict):
+        async with semaphore:
+            transcript_data = await client.get_transcript(meeting["recording_id"])
+        return transcript_data.get("transcript")
+
+    results = await asyncio.gather(*(fetch_one(m) for m in pending), return_exceptions=True)
+
+    transcripts = {}
+    failed = 0
+    for meeting, outcome in zip(pending, results):
+        if isinstance(outcome, Exception):
+            failed += 1
+            if _is_lasting_failure(outcome):
+                _transcript_failures.set(meeting["recording_id"], True)
+            await _log_debug(ctx, "Could not fetch transcript for {}: {}", meeting["recording_id"], outcome)
+        else:
+            transcripts[meeting["recording_id"]] = outcome
+    if failed:
+        await ctx.info(f"Could not fetch {failed} of {len(pending)} transcripts")
+    return transcripts
 
 
 async def search_meetings(
     ctx: Context,
     query: str,
-    include_transcript: bool = False
+    include_transcript: bool = False,
+    max_matches: int = DEFAULT_MAX_MATCHES
 ) -> dict:
     """Search meetings by keyword across titles, participants, teams, topics, and optionally transcripts.
     
@@ -144,12 +415,14 @@ async def search_meetings(
     matching meetings with their recording_id, summary, and optionally transcripts. Uses fuzzy matching
     to handle partial matches, plurals, and case-insensitive search.
     
-    Fetches up to 10 pages (500 meetings max) to provide comprehensive search results.
+    Searches up to 500 meetings, requested in as few pages as the API allows, matching each
+    page as it arrives and stopping as soon as max_matches meetings have matched.
     
     Args:
         ctx: MCP context for logging
         query: Search query string to match against meeting metadata
         include_transcript: If True, search within transcripts and include them in results (default: False)
+        max_matches: Stop searching once this many meetings have matched (default: 50)
     
     Returns:
         dict: {
@@ -172,80 +445,75 @@ async def search_meetings(
         
         # Normalize the search query
         search_normalized = _normalize_search(query)
+        query_lower = query.strip().lower()
+        search_terms = _search_terms(query)
         
-        # Fetch all meetings (with pagination, max 10 pages = 500 meetings)
-        all_meetings = []
-        cursor: Optional[str] = None
-        page = 1
-        max_pages = 10
-        
-        while page <= max_pages:
-            await ctx.info(f"Fetching meetings page {page}/{max_pages}")
-            
-            params = {
-                "include_summary": True  # Always include summaries in search results
-            }
-            if cursor:
-                params["cursor"] = cursor
-            
-            response = await client.get_meetings(params=params)
-            items = response.get("items", [])
-            
-            if not items:
-                break
-            
-            all_meetings.extend(items)
-            
-            # Check for next page
-            cursor = response.get("cursor")
-            if not cursor:
-                break
-            
-            page += 1
-        
-        await ctx.info(f"Total meetings fetched: {len(all_meetings)}")
-        
-        # If including transcripts, fetch them for meetings that don't have them
-        if include_transcript:
-            await ctx.info("Fetching transcripts for meetings...")
-            for meeting in all_meetings:
-                if not meeting.get("transcript"):
-                    recording_id = meeting.get("recording_id")
-                    if recording_id:
-                        try:
-                            transcript_data = await client.get_transcript(recording_id)
-                            meeting["transcript"] = transcript_data.get("transcript")
-                        except Exception as e:
-                            await ctx.info(f"Could not fetch transcript for {recording_id}: {str(e)}")
-        
-        # Filter meetings by search query and track where matches are found
-        matched_meetings = []
-        
+        # Fetch meetings page by page (max 500 meetings), matching each page as
+        # it arrives and stopping early once max_matches is reached
+        meetings_searched = 0
+        filtered_meetings = []
+        params = {
+            "include_summary": True  # Always include summaries in search results
+        }
         if include_transcript:
-            for m in all_meetings:
-                matches, found_in_transcript = _meeting_matches_search_with_transcript(m, search_normalized)
-                if matches:
-                    matched_meetings.append((m, found_in_transcript))
-        else:
-            for m in all_meetings:
-                matches, _ = _meeting_matches_search(m, search_normalized)
-                if matches:
-                    matched_meetings.append((m, False))
-        
-        # Apply field filtering
-        filtered_meetings = [
-            _filter_meeting_fields(m, found_in_transcript=found_in_transcript)
-            for m, found_in_transcript in matched_meetings
-        ]
-        
+            # Have /meetings embed transcripts so a page needs one request instead of one per
+            # meeting; _fetch_transcripts then only fetches for meetings that came back without one.
+            # These pages are kept at DEFAULT_PER_PAGE and never cached by the client
+            params["include_transcript"] = True
+
+        page = 0
+        async with aclosing(_iter_meeting_pages(params, MAX_MEETINGS_SEARCHED)) as pages:
+            async for items in pages:
+                page += 1
+                await _log_debug(ctx, "Fetched meetings page {} ({} meetings)", page, len(items))
+                meetings_searched += len(items)
+
+                # Match metadata for the whole page at once. Transcripts are then fetched
+                # only for meetings that metadata didn't match, since only those need them.
+                # Each match is projected to its output fields right away so raw meetings
+                # aren't retained until the end
+                metadata_hits = _search_index(items).matching(search_normalized, search_terms)
+
+                # Results keep page order, so once enough metadata hits are ahead of a
+                # meeting, nothing after it can make the cut and it isn't scanned at all
+                remaining = max_matches - len(filtered_meetings)
+                if len(metadata_hits) >= remaining:
+                    items = items[:sorted(metadata_hits)[remaining - 1] + 1]
+
+                transcripts = {}
+                if include_transcript:
+                    transcripts = await _fetch_transcripts(
+                        ctx, [m for index, m in enumerate(items) if index not in metadata_hits]
+                    )
+                for index, m in enumerate(items):
+                    if index in metadata_hits:
+                        found_in_transcript = False
+                    elif include_transcript and _transcript_matches(
+                        m.get("transcript") or transcripts.get(m.get("recording_id")),
+                        search_normalized, search_terms, query_lower
+                    ):
+                        found_in_transcript = True
+                    else:
+                        continue
+                    filtered_meetings.append(
+                        _filter_meeting_fields(m, found_in_transcript=found_in_transcript)
+                    )
+                    if len(filtered_meetings) >= max_matches:
+                        break
+
+                if len(filtered_meetings) >= max_matches:
+                    await _log_debug(ctx, "Reached {} matches, stopping search early", max_matches)
+                    break
+
         await ctx.info(
-            f"Search completed: found {len(matched_meetings)} matches out of {len(all_meetings)} meetings"
+            f"Search completed: found {len(filtered_meetings)} matches out of "
+            f"{meetings_searched} meetings across {page} pages"
         )
         
         result = {
             "items": filtered_meetings,
             "query": query,
-            "total_matches": len(matched_meetings),
+            "total_matches": len(filtered_meetings),
             "searched_transcripts": include_transcript
         }
 
@@ -1,74 +1,108 @@
 from typing import Any, Dict
 
 
-def remove_null_and_empty(obj: Any) -> Any:
-    """Recursively remove null, empty dicts/lists, and empty strings from a dict/list."""
-    if isinstance(obj, dict):
-        result = {}
-        
-        for key, value in obj.items():
-            # Skip fields that are not useful for LLMs
-            if key in ["links"]:
-                continue
-                
-            cleaned_value = remove_null_and_empty(value)
-            
-            # Skip empty values
-            if cleaned_value in (None, "", {}, []):
-                continue
-            
-            result[key] = cleaned_value
-        
-        return result
-    
-    elif isinstance(obj, list):
-        result = []
-        for item in obj:
-            cleaned_item = remove_null_and_empty(item)
-            if cleaned_item not in (None, "", {}, []):
-                result.append(cleaned_item)
-        return result
-    
-    else:
-        return obj
+# Keys dropped everywhere in a response because they are not useful for LLMs
+_SKIP_KEYS = frozenset({"links"})
 
+# Keys dropped from meeting items, and from their invitees and recorder, to reduce output size
+_DROP_KEYS = frozenset({"meeting_title", "calendar_invitees_domains_type"})
+_CONTACT_DROP_KEYS = frozenset({"email_domain"})
 
-def filter_response(response: Dict[str, Any]) -> Dict[str, Any]:
-    """Filter Fathom API response: remove sensitive fields and clean empty values."""
-    # First, apply the key filtering
-    filtered = filter_sensitive_keys(response)
-    # Then, remove null and empty values
-    return remove_null_and_empty(filtered)
+# Key-removal specs for the cleaning walk: (keys dropped from a dict, child key -> (type, spec)).
+# A child spec applies only when the value has the expected type; a list passes its spec on
+# to its dict elements. Everything else gets _DEFAULT_SPEC.
+_DEFAULT_SPEC = (_SKIP_KEYS, {})
+_CONTACT_SPEC = (_SKIP_KEYS | _CONTACT_DROP_KEYS, {})
+_ITEM_SPEC = (
+    _SKIP_KEYS | _DROP_KEYS,
+    {"calendar_invitees": (list, _CONTACT_SPEC), "recorded_by": (dict, _CONTACT_SPEC)},
+)
+_RESPONSE_SPEC = (_SKIP_KEYS, {"items": (list, _ITEM_SPEC)})
+_NO_CHILD_SPEC = (None, _DEFAULT_SPEC)
 
 
-def filter_sensitive_keys(data: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Filter specific keys from the response data to reduce output size.
-    Removes meeting_title, calendar_invitees_domains_type from items,
-    and email_domain from calendar_invitees and recorded_by.
+def _clean(obj: Any, spec: tuple) -> Any:
+    """Copy obj without null/empty values and the keys its spec drops, in one iterative walk.
+
+    Containers are walked depth-first off an explicit stack instead of recursing per
+    value. A copied container is attached to its parent only once it is finished and
+    known to be non-empty, so emptiness is a plain truth test and no pruning pass or
+    equality comparison against empty literals is needed. Parsed JSON only ever holds
+    plain dicts and lists, so containers are recognized with exact ``type() is`` checks.
     """
-    if not isinstance(data, dict):
-        return data
+    obj_type = type(obj)
+    if obj_type is not dict and obj_type is not list:
+        return obj
+
+    root = {} if obj_type is dict else []
+    # (remaining source items, copy being built, spec, parent copy, key in parent)
+    stack = [(iter(obj.items()) if obj_type is dict else iter(obj), root, spec, None, None)]
 
-    # Make a copy to avoid modifying the original
-    filtered = data.copy()
+    while stack:
+        items, target, spec, parent, parent_key = stack[-1]
+        is_dict = type(target) is dict
+        drop, child_specs = spec
+        descended = False
 
-    if "items" in filtered and isinstance(filtered["items"], list):
-        for item in filtered["items"]:
-            if isinstance(item, dict):
-                # Remove top-level keys
-                item.pop("meeting_title", None)
-                item.pop("calendar_invitees_domains_type", None)
+        for item in items:
+            if is_dict:
+                key, value = item
+                # Skip fields that are not useful for LLMs
+                if key in drop:
+                    continue
+            else:
+                value = item
 
-                # Filter calendar_invitees
-                if "calendar_invitees" in item and isinstance(item["calendar_invitees"], list):
-                    for invitee in item["calendar_invitees"]:
-                        if isinstance(invitee, dict):
-                            invitee.pop("email_domain", None)
+            value_type = type(value)
+            if value_type is dict or value_type is list:
+                if value:
+                    # Finish this child before resuming the current container, which keeps order
+                    child = {} if value_type is dict else []
+                    source = value.items() if value_type is dict else value
+                    if is_dict:
+                        expected_type, child_spec = child_specs.get(key, _NO_CHILD_SPEC)
+                        if value_type is not expected_type:
+                            child_spec = _DEFAULT_SPEC
+                        stack.append((iter(source), child, child_spec, target, key))
+                    else:
+                        child_spec = spec if value_type is dict else _DEFAULT_SPEC
+                        stack.append((iter(source), child, child_spec, target, None))
+                    descended = True
+                    break
+            elif value is None or (value_type is str and not value):
+                continue
+            elif is_dict:
+                target[key] = value
+            else:
+                target.append(value)
+
+        if descended:
+            continue
+
+        stack.pop()
+        # Children that ended up empty once cleaned are simply never attached
+        if parent is not None and target:
+            if type(parent) is dict:
+                parent[parent_key] = target
+            else:
+                parent.append(target)
 
-                # Filter recorded_by
-                if "recorded_by" in item and isinstance(item["recorded_by"], dict):
-                    item["recorded_by"].pop("email_domain", None)
+    return root
 
-    return filtered
 
+def remove_null_and_empty(obj: Any) -> Any:
+    """Remove null, empty dicts/lists, and empty strings from a dict/list in a single iterative pass."""
+    return _clean(obj, _DEFAULT_SPEC)
+
+
+def filter_response(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Filter Fathom API response: remove sensitive fields and clean empty values.
+
+    Removes meeting_title and calendar_invitees_domains_type from items, and email_domain
+    from calendar_invitees and recorded_by. Key removal and empty-value pruning happen in
+    the same walk, and the response is copied rather than mutated, so cached API data
+    stays intact.
+    """
+    if type(response) is not dict:
+        return remove_null_and_empty(response)
+    return _clean(response, _RESPONSE_SPEC)